@@ -0,0 +1,14 @@
+from typing import Optional
+
+from fastapi import Request
+from redis import asyncio as aioredis
+
+from app.services.jagriti_service import JagritiService
+
+
+async def get_jagriti_service(request: Request) -> JagritiService:
+    return request.app.state.jagriti
+
+
+async def get_redis(request: Request) -> Optional[aioredis.Redis]:
+    return request.app.state.redis
@@ -1,18 +1,19 @@
-from fastapi import APIRouter, HTTPException
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List
 from datetime import datetime
 
+import orjson
+
+from app.api.deps import get_jagriti_service
+from app.core.config import settings
 from app.schemas.case import CaseSearchRequest, CaseResponse, SearchType
 from app.services.jagriti_service import JagritiService
-from app.core.exceptions import StateNotFoundException, CommissionNotFoundException, JagritiServiceException
-
-router = APIRouter()
 
+router = APIRouter(default_response_class=ORJSONResponse)
 
-async def get_jagriti_service() -> JagritiService:
-    service = JagritiService()
-    await service.initialize()
-    return service
+_STARTED_AT = datetime.now().isoformat()
 
 
 async def handle_search(
@@ -20,65 +21,79 @@ async def handle_search(
     search_type: SearchType,
     service: JagritiService
 ) -> List[CaseResponse]:
-    try:
-        return await service.search_cases(
-            search_type,
-            request.state,
-            request.commission,
-            request.search_value
+    return await service.search_cases(
+        search_type,
+        request.state,
+        request.commission,
+        request.search_value
+    )
+
+
+SEARCH_TYPE_MAP = {
+    "case-number": SearchType.CASE_NUMBER,
+    "complainant": SearchType.COMPLAINANT,
+    "respondent": SearchType.RESPONDENT,
+    "complainant-advocate": SearchType.COMPLAINANT_ADVOCATE,
+    "respondent-advocate": SearchType.RESPONDENT_ADVOCATE,
+    "industry-type": SearchType.INDUSTRY_TYPE,
+    "judge": SearchType.JUDGE,
+}
+
+
+def search_etag(search_by: str, request: CaseSearchRequest) -> str:
+    fingerprint = orjson.dumps(
+        {"search_by": search_by, **request.model_dump()},
+        option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.blake2b(fingerprint, digest_size=8).hexdigest()
+
+
+@router.post("/cases/by-{search_by}", response_model=List[CaseResponse])
+async def search_cases(
+    request: CaseSearchRequest,
+    http_request: Request,
+    response: Response,
+    search_by: str = Path(..., description="Search field, e.g. case-number or complainant"),
+    service: JagritiService = Depends(get_jagriti_service)
+):
+    search_type = SEARCH_TYPE_MAP.get(search_by)
+    if search_type is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown search type '{search_by}'. Available: {sorted(SEARCH_TYPE_MAP)}"
         )
-    except StateNotFoundException as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except CommissionNotFoundException as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except JagritiServiceException as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-
-@router.post("/cases/by-case-number", response_model=List[CaseResponse])
-async def search_by_case_number(request: CaseSearchRequest):
-    service = await get_jagriti_service()
-    return await handle_search(request, SearchType.CASE_NUMBER, service)
-
 
-@router.post("/cases/by-complainant", response_model=List[CaseResponse])
-async def search_by_complainant(request: CaseSearchRequest):
-    service = await get_jagriti_service()
-    return await handle_search(request, SearchType.COMPLAINANT, service)
+    etag = search_etag(search_by, request)
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
 
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = f"private, max-age={settings.CACHE_TTL_CASES}"
+    return await handle_search(request, search_type, service)
 
-@router.post("/cases/by-respondent", response_model=List[CaseResponse])
-async def search_by_respondent(request: CaseSearchRequest):
-    service = await get_jagriti_service()
-    return await handle_search(request, SearchType.RESPONDENT, service)
-
-
-@router.post("/cases/by-complainant-advocate", response_model=List[CaseResponse])
-async def search_by_complainant_advocate(request: CaseSearchRequest):
-    service = await get_jagriti_service()
-    return await handle_search(request, SearchType.COMPLAINANT_ADVOCATE, service)
-
-
-@router.post("/cases/by-respondent-advocate", response_model=List[CaseResponse])
-async def search_by_respondent_advocate(request: CaseSearchRequest):
-    service = await get_jagriti_service()
-    return await handle_search(request, SearchType.RESPONDENT_ADVOCATE, service)
 
+@router.post("/cases/by-{search_by}/stream")
+async def search_cases_stream(
+    request: CaseSearchRequest,
+    search_by: str = Path(..., description="Search field, e.g. case-number or complainant"),
+    service: JagritiService = Depends(get_jagriti_service)
+):
+    search_type = SEARCH_TYPE_MAP.get(search_by)
+    if search_type is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown search type '{search_by}'. Available: {sorted(SEARCH_TYPE_MAP)}"
+        )
 
-@router.post("/cases/by-industry-type", response_model=List[CaseResponse])
-async def search_by_industry_type(request: CaseSearchRequest):
-    service = await get_jagriti_service()
-    return await handle_search(request, SearchType.INDUSTRY_TYPE, service)
+    cases = await handle_search(request, search_type, service)
 
+    def render():
+        for case in cases:
+            yield orjson.dumps(case.model_dump()) + b"\n"
 
-@router.post("/cases/by-judge", response_model=List[CaseResponse])
-async def search_by_judge(request: CaseSearchRequest):
-    service = await get_jagriti_service()
-    return await handle_search(request, SearchType.JUDGE, service)
+    return StreamingResponse(render(), media_type="application/x-ndjson")
 
 
 @router.get("/cases/health")
 async def cases_health_check():
-    return {"status": "healthy", "service": "cases", "timestamp": datetime.now().isoformat()}
\ No newline at end of file
+    return {"status": "healthy", "service": "cases", "started_at": _STARTED_AT}
\ No newline at end of file
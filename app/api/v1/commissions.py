@@ -1,34 +1,69 @@
-from fastapi import APIRouter, HTTPException, Path
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Path, Request, Response
+from fastapi.responses import ORJSONResponse
+from redis import asyncio as aioredis
+
+from app.api.deps import get_jagriti_service, get_redis
+from app.core.config import settings
 from app.schemas.commission import CommissionsListResponse, CommissionResponse
 from app.services.jagriti_service import JagritiService
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get("/commissions/{state_id}", response_model=CommissionsListResponse)
-async def get_commissions(state_id: str = Path(..., description="State ID")):
-    try:
-        service = JagritiService()
-        await service.initialize()
-        commissions_data = await service.get_commissions(state_id)
-        
-        commissions = [
-            CommissionResponse(
-                id=comm['id'],
-                name=comm['name'],
-                display_name=comm['display_name'],
-                state_id=comm['state_id']
-            )
-            for comm in commissions_data
-        ]
-        
-        return CommissionsListResponse(
-            commissions=commissions,
-            total=len(commissions),
-            state_id=state_id
+async def get_commissions(
+    request: Request,
+    state_id: str = Path(..., description="State ID"),
+    service: JagritiService = Depends(get_jagriti_service),
+    redis: Optional[aioredis.Redis] = Depends(get_redis)
+):
+    snapshot = request.app.state.commissions_json.get(state_id)
+    if snapshot is not None:
+        return Response(
+            content=snapshot,
+            media_type="application/json",
+            headers={
+                "Cache-Control": f"public, max-age={settings.CACHE_TTL_COMMISSIONS}"
+            }
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, 
-            detail=f"Failed to fetch commissions: {str(e)}"
-        )
\ No newline at end of file
+
+    cache_key = f"commissions:v1:{state_id}"
+
+    if redis is not None:
+        try:
+            cached = await redis.get(cache_key)
+            if cached:
+                return Response(content=cached, media_type="application/json")
+        except Exception as e:
+            logger.debug("Commissions cache read failed: %s", e)
+
+    commissions_data = await service.get_commissions(state_id)
+
+    commissions = [
+        CommissionResponse.model_construct(
+            id=comm['id'],
+            name=comm['name'],
+            display_name=comm['display_name'],
+            state_id=comm['state_id']
+        )
+        for comm in commissions_data
+    ]
+
+    body = CommissionsListResponse.model_construct(
+        commissions=commissions,
+        total=len(commissions),
+        state_id=state_id
+    ).model_dump_json()
+
+    if redis is not None:
+        try:
+            await redis.setex(cache_key, settings.CACHE_TTL_COMMISSIONS, body)
+        except Exception as e:
+            logger.debug("Commissions cache write failed: %s", e)
+
+    return Response(content=body, media_type="application/json")
@@ -1,26 +1,69 @@
-from fastapi import APIRouter, HTTPException
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+from redis import asyncio as aioredis
+
+from app.api.deps import get_jagriti_service, get_redis
+from app.core.config import settings
 from app.schemas.state import StatesListResponse, StateResponse
 from app.services.jagriti_service import JagritiService
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+STATES_CACHE_KEY = "states:v1"
 
 
 @router.get("/states", response_model=StatesListResponse)
-async def get_states():
-    try:
-        service = JagritiService()
-        await service.initialize()
-        states_data = await service.get_states()
-        
-        states = [
-            StateResponse(
-                id=state['id'],
-                name=state['name'],
-                display_name=state['display_name']
-            )
-            for state in states_data
-        ]
-        
-        return StatesListResponse(states=states, total=len(states))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch states: {str(e)}")
\ No newline at end of file
+async def get_states(
+    request: Request,
+    service: JagritiService = Depends(get_jagriti_service),
+    redis: Optional[aioredis.Redis] = Depends(get_redis)
+):
+    snapshot = request.app.state.states_json
+    if snapshot is not None:
+        etag = request.app.state.states_etag
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        return Response(
+            content=snapshot,
+            media_type="application/json",
+            headers={
+                "ETag": etag,
+                "Cache-Control": f"public, max-age={settings.CACHE_TTL_STATES}"
+            }
+        )
+
+    if redis is not None:
+        try:
+            cached = await redis.get(STATES_CACHE_KEY)
+            if cached:
+                return Response(content=cached, media_type="application/json")
+        except Exception as e:
+            logger.debug("States cache read failed: %s", e)
+
+    states_data = await service.get_states()
+
+    states = [
+        StateResponse.model_construct(
+            id=state['id'],
+            name=state['name'],
+            display_name=state['display_name']
+        )
+        for state in states_data
+    ]
+
+    body = StatesListResponse.model_construct(
+        states=states, total=len(states)
+    ).model_dump_json()
+
+    if redis is not None:
+        try:
+            await redis.setex(STATES_CACHE_KEY, settings.CACHE_TTL_STATES, body)
+        except Exception as e:
+            logger.debug("States cache write failed: %s", e)
+
+    return Response(content=body, media_type="application/json")
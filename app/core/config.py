@@ -1,4 +1,6 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional
 
 
@@ -10,6 +12,7 @@ class Settings(BaseSettings):
     JAGRITI_BASE_URL: str = "https://e-jagriti.gov.in"
     JAGRITI_TIMEOUT: int = 60
     JAGRITI_MAX_RETRIES: int = 3
+    MAX_CONCURRENT_REQUESTS: int = 10
     REQUEST_DELAY: float = 2.0
     
     JAGRITI_USERNAME: Optional[str] = None
@@ -25,6 +28,10 @@ class Settings(BaseSettings):
     LOG_ROTATION: str = "1 day"
     LOG_RETENTION: str = "30 days"
     
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    DISK_CACHE_DIR: str = ".jagriti_cache"
+
     CACHE_TTL_STATES: int = 86400
     CACHE_TTL_COMMISSIONS: int = 3600 
     CACHE_TTL_CASES: int = 300
@@ -32,15 +39,22 @@ class Settings(BaseSettings):
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_WINDOW: int = 3600
     
-    DATABASE_URL: str = "sqlite:///./cases.db"
+    DATABASE_URL: str = "sqlite+aiosqlite:///./cases.db"
     
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-        extra = "ignore"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True
+    )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
 
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -21,4 +21,16 @@ class CommissionNotFoundException(JagritiServiceException):
 
 
 class SearchTimeoutException(JagritiServiceException):
+    pass
+
+
+class CaptchaRequiredException(JagritiServiceException):
+    pass
+
+
+class SessionExpiredException(JagritiServiceException):
+    pass
+
+
+class RateLimitExceededException(JagritiServiceException):
     pass
\ No newline at end of file
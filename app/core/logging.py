@@ -1,29 +1,50 @@
 import logging
+import queue
 import sys
-import os
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from app.core.config import settings
 
 
-def setup_logging():
+def setup_logging() -> QueueListener:
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
-    
+
     log_file = log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
-    
-    logging.basicConfig(
-        level=getattr(logging, settings.LOG_LEVEL.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(log_file, encoding='utf-8')
-        ]
+
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+    )
+
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=50_000_000, backupCount=10, encoding='utf-8'
     )
-    
+    file_handler.setFormatter(formatter)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    # Hot-path logging calls only enqueue the record; the listener thread
+    # does the formatting and disk/stdout writes.
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
+    root.handlers = [QueueHandler(log_queue)]
+
+    listener = QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
-    
+
     logger = logging.getLogger(__name__)
-    logger.info("Logging system initialized successfully")
\ No newline at end of file
+    logger.info("Logging system initialized successfully")
+    return listener
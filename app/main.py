@@ -1,41 +1,151 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
+import hashlib
 import logging
 
-from app.core.config import settings
-from app.api.v1 import cases, states, commissions
+import orjson
+from redis import asyncio as aioredis
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+from app.core.config import settings
+from app.core.exceptions import (
+    StateNotFoundException,
+    CommissionNotFoundException,
+    JagritiServiceException,
 )
+from app.api.v1 import cases, states, commissions
+from app.core.logging import setup_logging
+from app.services.jagriti_service import JagritiService
+
+logger = logging.getLogger(__name__)
+
+log_listener = setup_logging()
+
+
+async def refresh_states_snapshot(app: FastAPI):
+    states_data = await app.state.jagriti.get_states()
+    body = orjson.dumps({"states": states_data, "total": len(states_data)})
+    app.state.states_json = body
+    app.state.states_etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    logger.info("States snapshot rebuilt (%s states)", len(states_data))
+
+
+async def states_snapshot_refresher(app: FastAPI):
+    while True:
+        await asyncio.sleep(settings.CACHE_TTL_STATES)
+        try:
+            # Force a real upstream fetch; get_states alone would just
+            # re-serialize the list cached at first initialize.
+            await app.state.jagriti.refresh_states()
+            await refresh_states_snapshot(app)
+        except Exception as e:
+            logger.warning("States snapshot refresh failed: %s", e)
+
+
+async def refresh_commissions_snapshot(app: FastAPI):
+    service = app.state.jagriti
+    states_data = await service.get_states()
+    semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+    snapshot = {}
+
+    async def fetch(state):
+        async with semaphore:
+            data = await service.get_commissions(state["id"])
+            snapshot[state["id"]] = orjson.dumps({
+                "commissions": data,
+                "total": len(data),
+                "state_id": state["id"]
+            })
+
+    await asyncio.gather(*(fetch(state) for state in states_data))
+    app.state.commissions_json = snapshot
+    logger.info("Commissions snapshot rebuilt for %s states", len(snapshot))
+
+
+async def commissions_snapshot_refresher(app: FastAPI):
+    # The first pass runs here rather than before lifespan yields: a
+    # full fill is on the order of a hundred token-bucket-paced portal
+    # requests, and blocking startup on it would keep the server from
+    # accepting connections for minutes on a cold boot.
+    while True:
+        try:
+            await refresh_commissions_snapshot(app)
+        except Exception as e:
+            logger.warning("Commissions snapshot refresh failed: %s", e)
+        await asyncio.sleep(settings.CACHE_TTL_COMMISSIONS)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    logging.info("Application starting up...")
+    logger.info("Application starting up...")
+    app.state.redis = None
+    try:
+        app.state.redis = aioredis.from_url(settings.REDIS_URL)
+        await app.state.redis.ping()
+        logger.info("Redis cache connected")
+    except Exception as e:
+        logger.warning("Redis unavailable, response caching disabled: %s", e)
+        app.state.redis = None
+    app.state.jagriti = JagritiService(redis=app.state.redis)
+    try:
+        await app.state.jagriti.initialize()
+    except Exception as e:
+        logger.warning("Jagriti service warmup failed, will retry lazily: %s", e)
+    app.state.states_json = None
+    app.state.states_etag = None
+    try:
+        await refresh_states_snapshot(app)
+    except Exception as e:
+        logger.warning("States snapshot build failed, serving uncached: %s", e)
+    app.state.commissions_json = {}
+    refreshers = [
+        asyncio.create_task(states_snapshot_refresher(app)),
+        asyncio.create_task(commissions_snapshot_refresher(app)),
+    ]
     yield
-    logging.info("Application shutting down...")
+    logger.info("Application shutting down...")
+    for refresher in refreshers:
+        refresher.cancel()
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
+    await app.state.jagriti.aclose()
+    log_listener.stop()
 
 
 app = FastAPI(
     title="Lexi Case Tracker API",
     description="API for tracking legal cases from Indian District Consumer Courts (DCDRC) - Real Data Integration",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if settings.DEBUG else None,
+    redoc_url="/redoc" if settings.DEBUG else None,
+    openapi_url="/openapi.json" if settings.DEBUG else None,
     lifespan=lifespan
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Wildcard origins together with credentials force Starlette's slow
+# per-request origin matching; keep the "*" fast path credential-free.
+if "*" in settings.ALLOWED_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=False,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+else:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.ALLOWED_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 app.include_router(cases.router, prefix="/api/v1", tags=["cases"])
 app.include_router(states.router, prefix="/api/v1", tags=["states"])
@@ -72,12 +182,45 @@ async def health_check():
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail, "status_code": exc.status_code}
     )
 
 
+@app.exception_handler(StateNotFoundException)
+@app.exception_handler(CommissionNotFoundException)
+async def not_found_exception_handler(request, exc):
+    return ORJSONResponse(
+        status_code=404,
+        content={"error": str(exc), "status_code": 404}
+    )
+
+
+@app.exception_handler(JagritiServiceException)
+async def jagriti_exception_handler(request, exc):
+    return ORJSONResponse(
+        status_code=400,
+        content={"error": str(exc), "status_code": 400}
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request, exc):
+    logger.error("Unhandled error: %s", exc)
+    return ORJSONResponse(
+        status_code=500,
+        content={"error": f"Internal server error: {str(exc)}", "status_code": 500}
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools"
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -16,15 +16,11 @@ class SearchType(str, Enum):
 
 
 class CaseSearchRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
     state: str = Field(..., description="State name", min_length=2)
     commission: str = Field(..., description="Commission name", min_length=3)
     search_value: str = Field(..., min_length=1, description="Search value")
-    
-    @validator('state', 'commission', 'search_value')
-    def validate_not_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Field cannot be empty')
-        return v.strip()
 
 
 class CaseResponse(BaseModel):
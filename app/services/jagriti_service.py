@@ -1,91 +1,273 @@
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Optional
+import time
+from bisect import bisect_right
+from typing import List, Dict, Iterable, Optional, Tuple
+
+import orjson
+from cachetools import LFUCache, TTLCache
+
+from app.core.config import settings
 from app.core.exceptions import StateNotFoundException, CommissionNotFoundException
 from app.schemas.case import CaseResponse, SearchType
 from app.utils.api_client import JagritiAPIClient
 
+logger = logging.getLogger(__name__)
+
+
+class _SubstringIndex:
+    # Single-scan "query in any name" lookup: all names are joined into
+    # one NUL-delimited blob so membership is one C-level str.find
+    # instead of a Python loop over every name. The query can never
+    # contain NUL, so a hit always falls inside exactly one name; the
+    # hit offset maps back to the owning entry via bisect.
+
+    def __init__(self, entries: Iterable[Tuple[str, Dict]]):
+        offsets = []
+        values = []
+        parts = []
+        pos = 0
+        for name, value in entries:
+            parts.append(name)
+            offsets.append(pos)
+            values.append(value)
+            pos += len(name) + 1
+        self._blob = "\x00".join(parts)
+        self._offsets = offsets
+        self._values = values
+
+    def find(self, query: str) -> Optional[Dict]:
+        if not query:
+            return None
+        hit = self._blob.find(query)
+        if hit == -1:
+            return None
+        return self._values[bisect_right(self._offsets, hit) - 1]
+
+
+def _search_cache_key(key: Tuple) -> str:
+    # User-supplied fields may themselves contain ':', so a plain
+    # ':'-join can collide across distinct searches; fingerprint the
+    # NUL-joined tuple instead, mirroring the ETag hash in cases.py.
+    digest = hashlib.blake2b("\x00".join(key).encode(), digest_size=8).hexdigest()
+    return "cases:v1:" + digest
+
 
 class JagritiService:
-    def __init__(self):
+    def __init__(self, redis=None):
         self.api_client = JagritiAPIClient()
+        self.redis = redis
         self.states_cache: Dict[str, Dict] = {}
-        self.commissions_cache: Dict[str, List[Dict]] = {}
+        self.states_list: List[Dict] = []
+        self.commissions_cache: TTLCache = TTLCache(
+            maxsize=64, ttl=settings.CACHE_TTL_COMMISSIONS
+        )
+        self._states_by_name: Dict[str, Dict] = {}
+        self._states_index: Optional[_SubstringIndex] = None
+        self._commissions_by_name: TTLCache = TTLCache(
+            maxsize=64, ttl=settings.CACHE_TTL_COMMISSIONS
+        )
+        self._commissions_index: TTLCache = TTLCache(
+            maxsize=64, ttl=settings.CACHE_TTL_COMMISSIONS
+        )
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._commission_locks: Dict[str, asyncio.Lock] = {}
+        self._search_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+        self._inflight_searches: Dict[Tuple, asyncio.Future] = {}
+        # LFU rather than LRU: popular queries repeat at long intervals
+        # and would be the first evicted under recency. Entries carry
+        # their own deadline since cachetools has no LFU+TTL combo.
+        self._search_cache: LFUCache = LFUCache(maxsize=1024)
         
     async def initialize(self):
         if self._initialized:
             return
-        
-        try:
-            states = await self.api_client.get_states()
-            if states:
-                self.states_cache = {state['id']: state for state in states}
-                self._initialized = True
-                logging.info(f"Initialized with {len(states)} states")
-            else:
-                raise Exception("No states received")
-                
-        except Exception as e:
-            logging.error(f"Initialization failed: {e}")
-            raise
-    
+
+        async with self._init_lock:
+            if self._initialized:
+                return
+
+            try:
+                states = await self.api_client.get_states()
+                if states:
+                    self._install_states(states)
+                    self._initialized = True
+                    logger.info("Initialized with %s states", len(states))
+                else:
+                    raise Exception("No states received")
+
+            except Exception as e:
+                logger.error("Initialization failed: %s", e)
+                raise
+
+    def _install_states(self, states: List[Dict]):
+        self.states_list = states
+        self.states_cache = {state['id']: state for state in states}
+        self._states_by_name = {}
+        # Normalized names live in side structures rather than
+        # on the state dicts, which are served verbatim.
+        self._states_index = _SubstringIndex(
+            (name, state)
+            for state in states
+            for name in (state['name'].upper(), state['display_name'].upper())
+        )
+        for state in states:
+            self._states_by_name[state['name'].casefold()] = state
+            self._states_by_name[state['display_name'].casefold()] = state
+
+    async def refresh_states(self) -> List[Dict]:
+        # Bypass every cache layer so the periodic refresher actually
+        # re-fetches; get_states alone would keep serving the list
+        # installed at first initialize forever.
+        states = await self.api_client.get_states(force_refresh=True)
+        if states:
+            self._install_states(states)
+            self._initialized = True
+            logger.info("Refreshed %s states from upstream", len(states))
+        return self.states_list
+
+    async def aclose(self):
+        await self.api_client.aclose()
+
     async def get_states(self) -> List[Dict]:
         if not self._initialized:
             await self.initialize()
-        return list(self.states_cache.values())
+        return self.states_list
     
     async def get_commissions(self, state_id: str) -> List[Dict]:
         if not self._initialized:
             await self.initialize()
             
-        cache_key = f"commissions_{state_id}"
-        
-        if cache_key not in self.commissions_cache:
-            commissions = await self.api_client.get_commissions(state_id)
-            self.commissions_cache[cache_key] = commissions
-        
-        return self.commissions_cache[cache_key]
+        if state_id not in self.commissions_cache:
+            lock = self._commission_locks.setdefault(state_id, asyncio.Lock())
+            async with lock:
+                if state_id not in self.commissions_cache:
+                    commissions = await self.api_client.get_commissions(state_id)
+                    self.commissions_cache[state_id] = commissions
+                    by_name = {}
+                    for comm in commissions:
+                        by_name[comm['name'].casefold()] = comm
+                        by_name[comm['display_name'].casefold()] = comm
+                    self._commissions_by_name[state_id] = by_name
+                    self._commissions_index[state_id] = _SubstringIndex(
+                        (name, comm)
+                        for comm in commissions
+                        for name in (comm['name'].lower(), comm['display_name'].lower())
+                    )
+
+        return self.commissions_cache[state_id]
     
     def find_state_by_name(self, state_name: str) -> Optional[Dict]:
-        state_name_clean = state_name.upper().strip()
-        
-        for state in self.states_cache.values():
-            if (state['name'].upper() == state_name_clean or 
-                state['display_name'].upper() == state_name_clean or
-                state_name_clean in state['name'].upper() or
-                state_name_clean in state['display_name'].upper()):
-                return state
-        return None
+        exact = self._states_by_name.get(state_name.strip().casefold())
+        if exact is not None:
+            return exact
+
+        if self._states_index is None:
+            return None
+        return self._states_index.find(state_name.upper().strip())
     
     def find_commission_by_name(self, state_id: str, commission_name: str) -> Optional[Dict]:
-        cache_key = f"commissions_{state_id}"
-        if cache_key not in self.commissions_cache:
+        if state_id not in self.commissions_cache:
             return None
-        
-        commission_name_clean = commission_name.lower().strip()
-        
-        for commission in self.commissions_cache[cache_key]:
-            comm_name = commission['name'].lower()
-            comm_display = commission['display_name'].lower()
-            
-            if (commission_name_clean == comm_name or 
-                commission_name_clean == comm_display or
-                commission_name_clean in comm_name or
-                commission_name_clean in comm_display):
-                return commission
-        return None
+
+        by_name = self._commissions_by_name.get(state_id)
+        if by_name is not None:
+            exact = by_name.get(commission_name.strip().casefold())
+            if exact is not None:
+                return exact
+
+        index = self._commissions_index.get(state_id)
+        if index is None:
+            return None
+        return index.find(commission_name.lower().strip())
     
     async def search_cases(
-        self, 
-        search_type: SearchType, 
-        state: str, 
-        commission: str, 
+        self,
+        search_type: SearchType,
+        state: str,
+        commission: str,
         search_value: str
     ) -> List[CaseResponse]:
-        
+
         if not self._initialized:
             await self.initialize()
-        
+
+        key = (search_type.value, state, commission, search_value)
+
+        entry = self._search_cache.get(key)
+        if entry is not None:
+            expires_at, cases = entry
+            if time.monotonic() < expires_at:
+                return cases
+            self._search_cache.pop(key, None)
+
+        cached = await self._get_cached_search(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight_searches.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_searches[key] = future
+        try:
+            cases = await self._do_search(search_type, state, commission, search_value)
+            future.set_result(cases)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._inflight_searches.pop(key, None)
+
+        if cases:
+            # Empty results are not cached so transient portal failures
+            # can retry immediately.
+            self._search_cache[key] = (
+                time.monotonic() + settings.CACHE_TTL_CASES, cases
+            )
+        await self._cache_search(key, cases)
+        return cases
+
+    async def _get_cached_search(self, key: Tuple) -> Optional[List[CaseResponse]]:
+        if self.redis is None:
+            return None
+        try:
+            cached = await self.redis.get(_search_cache_key(key))
+            if cached:
+                return [CaseResponse.model_construct(**case) for case in orjson.loads(cached)]
+        except Exception as e:
+            logger.debug("Search cache read failed: %s", e)
+        return None
+
+    async def _cache_search(self, key: Tuple, cases: List[CaseResponse]):
+        # Same policy as the in-process cache above: _do_search collapses
+        # upstream failures to [], and pinning that in Redis for a full
+        # TTL would block retries after a transient outage.
+        if not cases:
+            return
+        if self.redis is None:
+            return
+        try:
+            await self.redis.setex(
+                _search_cache_key(key),
+                settings.CACHE_TTL_CASES,
+                orjson.dumps([case.model_dump() for case in cases])
+            )
+        except Exception as e:
+            logger.debug("Search cache write failed: %s", e)
+
+    async def _do_search(
+        self,
+        search_type: SearchType,
+        state: str,
+        commission: str,
+        search_value: str
+    ) -> List[CaseResponse]:
+
         state_info = self.find_state_by_name(state)
         if not state_info:
             available = [s['display_name'] for s in await self.get_states()]
@@ -108,11 +290,11 @@ class JagritiService:
         }
         
         try:
-            raw_cases = await self.api_client.search_cases(search_params)
-            
-            cases = []
-            for case_data in raw_cases:
-                case = CaseResponse(
+            async with self._search_semaphore:
+                raw_cases = await self.api_client.search_cases(search_params)
+
+            cases = [
+                CaseResponse.model_construct(
                     case_number=case_data.get("case_number", ""),
                     case_stage=case_data.get("case_stage", ""),
                     filing_date=case_data.get("filing_date", ""),
@@ -122,11 +304,12 @@ class JagritiService:
                     respondent_advocate=case_data.get("respondent_advocate"),
                     document_link=case_data.get("document_link")
                 )
-                cases.append(case)
-            
-            logging.info(f"Search returned {len(cases)} cases for {search_type.value}: {search_value}")
+                for case_data in raw_cases
+            ]
+
+            logger.info("Search returned %s cases for %s: %s", len(cases), search_type.value, search_value)
             return cases
             
         except Exception as e:
-            logging.error(f"Case search failed: {e}")
+            logger.error("Case search failed: %s", e)
             return []
\ No newline at end of file
@@ -1,20 +1,109 @@
 import logging
-from typing import Dict, List
+import os
+import time
+from typing import Dict, List, Optional
+
+import orjson
+
+from app.core.config import settings
 from app.utils.jagriti_scraper import JagritiClient
 
+logger = logging.getLogger(__name__)
+
+# Only persist results that were genuinely expensive to produce: slow
+# upstream calls or sizeable row sets. Fallback data never reaches the
+# write path at all (only real extractions are cached below); this
+# gate just skips trivially cheap tiny results.
+_CACHE_MIN_ELAPSED = 0.2
+_CACHE_MIN_ROWS = 20
+
+
+def _worth_caching(elapsed: float, data: List[Dict]) -> bool:
+    return elapsed > _CACHE_MIN_ELAPSED or len(data) > _CACHE_MIN_ROWS
+
 
 class JagritiAPIClient:
     def __init__(self):
         self.client = JagritiClient()
-    
-    async def get_states(self) -> List[Dict]:
-        logging.info("Attempting to fetch states from real Jagriti portal...")
-        return await self.client.get_states()
-    
-    async def get_commissions(self, state_id: str) -> List[Dict]:
-        logging.info(f"Attempting to fetch commissions for state {state_id} from real portal...")
-        return await self.client.get_commissions(state_id)
-    
+        self.cache_dir = settings.DISK_CACHE_DIR
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def _read_disk_cache(self, name: str, ttl: int) -> Optional[List[Dict]]:
+        # States and commissions change rarely; a warm process restart
+        # should serve them from disk instead of re-scraping the portal.
+        path = os.path.join(self.cache_dir, name + ".json")
+        try:
+            with open(path, "rb") as fh:
+                entry = orjson.loads(fh.read())
+            if time.time() - entry["saved_at"] <= ttl:
+                return entry["data"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug("Disk cache read for %s failed: %s", name, e)
+        return None
+
+    def _write_disk_cache(self, name: str, data: List[Dict]):
+        path = os.path.join(self.cache_dir, name + ".json")
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(orjson.dumps({"saved_at": time.time(), "data": data}))
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.debug("Disk cache write for %s failed: %s", name, e)
+
+    async def get_states(self, force_refresh: bool = False) -> List[Dict]:
+        if not force_refresh:
+            cached = self._read_disk_cache("states", settings.CACHE_TTL_STATES)
+            if cached:
+                logger.info("Loaded %s states from disk cache", len(cached))
+                return cached
+
+        logger.info("Attempting to fetch states from real Jagriti portal...")
+        started = time.perf_counter()
+        # Cache below the fallback layer: only real extraction results
+        # may be written, otherwise fabricated state IDs would survive
+        # restarts and suppress re-fetching after the portal recovers.
+        states = await self.client.get_states_real()
+        if states:
+            if _worth_caching(time.perf_counter() - started, states):
+                self._write_disk_cache("states", states)
+            return states
+        logger.warning("Real portal unavailable, using fallback states")
+        return self.client.fallback_states
+
+    async def get_commissions(self, state_id: str, force_refresh: bool = False) -> List[Dict]:
+        if not force_refresh:
+            cached = self._read_disk_cache(
+                f"commissions_{state_id}", settings.CACHE_TTL_COMMISSIONS
+            )
+            if cached:
+                logger.info("Loaded %s commissions for %s from disk cache", len(cached), state_id)
+                return cached
+
+        logger.info("Attempting to fetch commissions for state %s from real portal...", state_id)
+        started = time.perf_counter()
+        try:
+            commissions = await self.client.get_commissions_real(state_id)
+        except Exception as e:
+            logger.error("Get commissions failed: %s", e)
+            return []
+        if commissions:
+            if _worth_caching(time.perf_counter() - started, commissions):
+                self._write_disk_cache(f"commissions_{state_id}", commissions)
+            return commissions
+        return self.client.generate_fallback_commissions(state_id)
+
     async def search_cases(self, params: Dict) -> List[Dict]:
-        logging.info("Attempting real case search on Jagriti portal...")
-        return await self.client.search_cases(params)
\ No newline at end of file
+        logger.info("Attempting real case search on Jagriti portal...")
+        return await self.client.search_cases(params)
+
+    async def aclose(self):
+        await self.client.aclose()
@@ -1,18 +1,135 @@
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-import json
-import re
+import os
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Any, TYPE_CHECKING
 from app.core.config import settings
+from app.utils.jagriti_scraper import parse_cases_from_html
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+# Chromium background services (translate, phishing detection, metrics,
+# extensions) burn CPU a scraper never benefits from; this is the same
+# streamlined set headless automation tooling defaults to.
+_CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-background-networking',
+    '--disable-breakpad',
+    '--disable-client-side-phishing-detection',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-default-apps',
+    '--disable-extensions',
+    '--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter,OptimizationHints',
+    '--disable-hang-monitor',
+    '--disable-ipc-flooding-protection',
+    '--disable-renderer-backgrounding',
+    '--force-color-profile=srgb',
+    '--metrics-recording-only',
+    '--mute-audio',
+]
+
+# Scraping only reads <select> options and result tables; media, styling
+# and analytics are dead weight on every navigation.
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'stylesheet', 'font', 'media'})
+_BLOCKED_URL_PARTS = ('google-analytics', 'googletagmanager')
+
+
+async def _block_non_essential(route):
+    request = route.request
+    if (request.resource_type in _BLOCKED_RESOURCE_TYPES or
+            any(part in request.url for part in _BLOCKED_URL_PARTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """Owns the one Chromium for the process; callers get cheap contexts.
+
+    Launching the browser costs seconds while a BrowserContext costs
+    milliseconds, so the browser is launched once behind a lock and
+    isolation between callers comes from per-caller contexts.
+    """
+
+    def __init__(self):
+        self._playwright = None
+        self._browser: Optional["Browser"] = None
+        self._lock = asyncio.Lock()
+
+    async def browser(self) -> "Browser":
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                # Imported here so API processes that never fall back to
+                # browser scraping don't pay playwright's import cost.
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=settings.USE_HEADLESS_BROWSER,
+                    args=_CHROMIUM_ARGS
+                )
+        return self._browser
+
+    @asynccontextmanager
+    async def acquire_context(self):
+        browser = await self.browser()
+        context_kwargs = {
+            'viewport': {'width': 1280, 'height': 720},
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+        }
+        # Mirror start_browser: without the persisted cookies a fan-out
+        # worker would run logged-out (and silently extract nothing)
+        # while its parent client reports authenticated=True.
+        if os.path.exists(_AUTH_STATE_PATH):
+            context_kwargs['storage_state'] = _AUTH_STATE_PATH
+        context = await browser.new_context(**context_kwargs)
+        await context.route('**/*', _block_non_essential)
+        try:
+            yield context
+        finally:
+            await context.close()
+
+    async def aclose(self):
+        async with self._lock:
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+pool = BrowserPool()
+
+# Serialized cookies + localStorage from the last successful login;
+# loading it into a fresh context skips the whole login/OTP flow.
+_AUTH_STATE_PATH = os.path.join(settings.DISK_CACHE_DIR, 'jagriti_auth.json')
+
+_shared_client: Optional["JagritiBrowserClient"] = None
+_shared_client_lock = asyncio.Lock()
+
+
+async def get_browser_client() -> "JagritiBrowserClient":
+    """Process-wide shared client so Chrome boots once, not per caller."""
+    global _shared_client
+    async with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = JagritiBrowserClient()
+        await _shared_client.start_browser()
+    return _shared_client
 
 
 class JagritiBrowserClient:
     def __init__(self):
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
+        self.browser: Optional["Browser"] = None
+        self.context: Optional["BrowserContext"] = None
+        self.page: Optional["Page"] = None
         self.authenticated = False
+        self._page_lock = asyncio.Lock()
         
     async def __aenter__(self):
         await self.start_browser()
@@ -21,67 +138,134 @@ class JagritiBrowserClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close_browser()
     
+    async def _wait_any(self, selectors: List[str], timeout_ms: int) -> Optional[str]:
+        # One in-page MutationObserver watching the whole candidate list
+        # resolves on the first selector to appear; sequential
+        # wait_for_selector calls pay each miss's full timeout in turn.
+        # Candidates must be CSS selectors (playwright-only syntax like
+        # text= can't run inside document.querySelector).
+        try:
+            return await self.page.evaluate(
+                '''([sels, ms]) => new Promise((resolve) => {
+                    const check = () => {
+                        for (const s of sels) {
+                            try { if (document.querySelector(s)) return s; }
+                            catch (e) {}
+                        }
+                        return null;
+                    };
+                    const first = check();
+                    if (first) return resolve(first);
+                    const obs = new MutationObserver(() => {
+                        const hit = check();
+                        if (hit) { obs.disconnect(); resolve(hit); }
+                    });
+                    obs.observe(document.documentElement,
+                                {childList: true, subtree: true, attributes: true});
+                    setTimeout(() => { obs.disconnect(); resolve(null); }, ms);
+                })''',
+                [selectors, timeout_ms]
+            )
+        except Exception as e:
+            logger.debug("_wait_any failed: %s", e)
+            return None
+
     async def start_browser(self):
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=settings.USE_HEADLESS_BROWSER,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
+        # The browser comes from the shared pool (launched once per
+        # process); this client only pays for its own context and page.
+        if self.page is not None and not self.page.is_closed():
+            return
+
+        self.browser = await pool.browser()
+        context_kwargs = {}
+        if os.path.exists(_AUTH_STATE_PATH):
+            context_kwargs['storage_state'] = _AUTH_STATE_PATH
         self.context = await self.browser.new_context(
             viewport={'width': 1280, 'height': 720},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+            **context_kwargs
         )
-        self.page = await self.context.new_page()
+        await self.context.route('**/*', _block_non_essential)
+        await self._bind_page(self.context)
+
+    async def _bind_page(self, context: "BrowserContext"):
+        self.context = context
+        self.page = await context.new_page()
         await self.page.set_default_timeout(settings.BROWSER_TIMEOUT)
-        
+        # Locators are lazy references; building them once per page saves
+        # re-parsing the same selector strings on every call.
+        self.loc_state_select = self.page.locator(
+            'select[name="state"], select#state, .state-select'
+        )
+        self.loc_commission_select = self.page.locator(
+            'select[name="commission"], select#commission, .commission-select'
+        )
+
     async def close_browser(self):
+        # The pooled browser stays up for the next caller; only this
+        # client's page and context are torn down.
         if self.page:
             await self.page.close()
+            self.page = None
         if self.context:
             await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if hasattr(self, 'playwright'):
-            await self.playwright.stop()
+            self.context = None
+        self.browser = None
     
+    async def _save_auth_state(self):
+        try:
+            os.makedirs(settings.DISK_CACHE_DIR, exist_ok=True)
+            await self.context.storage_state(path=_AUTH_STATE_PATH)
+            logger.info("Saved authenticated browser state")
+        except Exception as e:
+            logger.debug("Saving browser auth state failed: %s", e)
+
     async def authenticate(self, mobile: str = None, password: str = None) -> bool:
         try:
             mobile = mobile or settings.JAGRITI_MOBILE
             password = password or settings.JAGRITI_PASSWORD
             
             if not mobile or not password:
-                logging.error("Mobile number and password required for authentication")
+                logger.error("Mobile number and password required for authentication")
                 return False
             
-            logging.info("Navigating to Jagriti portal...")
+            logger.info("Navigating to Jagriti portal...")
             await self.page.goto(settings.JAGRITI_BASE_URL)
+
+            await self.page.wait_for_load_state('domcontentloaded')
             
-            await self.page.wait_for_timeout(3000)
-            
-            login_button_selectors = [
+            # The CSS candidates collapse into one comma-joined query (the
+            # engine treats it as an OR); only playwright text= selectors
+            # need individual attempts.
+            login_css = '[data-testid="login-button"], .login-btn, #loginBtn'
+            login_text_selectors = [
                 'text="Login"',
                 'text="Sign In"',
-                'button:has-text("Login")',
-                '[data-testid="login-button"]',
-                '.login-btn',
-                '#loginBtn'
+                'button:has-text("Login")'
             ]
-            
+
             login_clicked = False
-            for selector in login_button_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    await self.page.click(selector)
-                    login_clicked = True
-                    logging.info(f"Clicked login button with selector: {selector}")
-                    break
-                except:
-                    continue
+            try:
+                await self.page.click(login_css, timeout=5000)
+                login_clicked = True
+                logger.info("Clicked login button via CSS candidates")
+            except Exception:
+                for selector in login_text_selectors:
+                    try:
+                        await self.page.click(selector, timeout=2000)
+                        login_clicked = True
+                        logger.info("Clicked login button with selector: %s", selector)
+                        break
+                    except:
+                        continue
             
             if not login_clicked:
-                logging.warning("Login button not found, checking if already on login page")
-            
-            await self.page.wait_for_timeout(2000)
+                logger.warning("Login button not found, checking if already on login page")
+            else:
+                try:
+                    await self.page.wait_for_load_state('networkidle', timeout=10000)
+                except Exception:
+                    pass
             
             mobile_input_selectors = [
                 'input[name="mobile"]',
@@ -93,18 +277,17 @@ class JagritiBrowserClient:
             ]
             
             mobile_filled = False
-            for selector in mobile_input_selectors:
+            selector = await self._wait_any(mobile_input_selectors, 10000)
+            if selector:
                 try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
                     await self.page.fill(selector, mobile)
                     mobile_filled = True
-                    logging.info(f"Filled mobile number with selector: {selector}")
-                    break
-                except:
-                    continue
+                    logger.info("Filled mobile number with selector: %s", selector)
+                except Exception as e:
+                    logger.debug("Filling mobile input %s failed: %s", selector, e)
             
             if not mobile_filled:
-                logging.error("Mobile input field not found")
+                logger.error("Mobile input field not found")
                 return False
             
             password_input_selectors = [
@@ -122,33 +305,43 @@ class JagritiBrowserClient:
                     if element:
                         await self.page.fill(selector, password)
                         password_filled = True
-                        logging.info(f"Filled password with selector: {selector}")
+                        logger.info("Filled password with selector: %s", selector)
                         break
                 except:
                     continue
             
             if password_filled:
-                submit_selectors = [
-                    'button[type="submit"]',
-                    'input[type="submit"]',
+                submit_css = ('button[type="submit"], input[type="submit"], '
+                              '.submit-btn, #submitBtn')
+                submit_text_selectors = [
                     'button:has-text("Login")',
-                    'button:has-text("Sign In")',
-                    '.submit-btn',
-                    '#submitBtn'
+                    'button:has-text("Sign In")'
                 ]
-                
-                for selector in submit_selectors:
-                    try:
-                        await self.page.click(selector)
-                        logging.info("Clicked submit button")
-                        break
-                    except:
-                        continue
-                        
-                await self.page.wait_for_timeout(3000)
+
+                try:
+                    await self.page.click(submit_css, timeout=5000)
+                    logger.info("Clicked submit button")
+                except Exception:
+                    for selector in submit_text_selectors:
+                        try:
+                            await self.page.click(selector, timeout=2000)
+                            logger.info("Clicked submit button")
+                            break
+                        except:
+                            continue
+
+                # Wake as soon as the post-login redirect lands instead
+                # of sleeping a fixed interval.
+                try:
+                    await self.page.wait_for_url(
+                        lambda url: 'dashboard' in url or 'home' in url,
+                        timeout=15000
+                    )
+                except Exception:
+                    pass
                 
                 if await self.check_otp_required():
-                    logging.info("OTP verification required - implement OTP handling")
+                    logger.info("OTP verification required - implement OTP handling")
                     return await self.handle_otp()
                 
             else:
@@ -162,7 +355,7 @@ class JagritiBrowserClient:
                 for selector in otp_selectors:
                     try:
                         await self.page.click(selector)
-                        logging.info("Clicked Send OTP button")
+                        logger.info("Clicked Send OTP button")
                         return await self.handle_otp()
                     except:
                         continue
@@ -170,39 +363,31 @@ class JagritiBrowserClient:
             current_url = self.page.url
             if 'dashboard' in current_url or 'home' in current_url or current_url != settings.JAGRITI_BASE_URL:
                 self.authenticated = True
-                logging.info("Authentication successful")
+                logger.info("Authentication successful")
+                await self._save_auth_state()
                 return True
                 
-            logging.error("Authentication failed")
+            logger.error("Authentication failed")
             return False
             
         except Exception as e:
-            logging.error(f"Authentication error: {e}")
+            logger.error("Authentication error: %s", e)
             return False
     
     async def check_otp_required(self) -> bool:
         otp_indicators = [
-            'text="Enter OTP"',
             'input[placeholder*="OTP"]',
             'input[placeholder*="otp"]',
+            'input[name="otp"]',
             '.otp-input',
             '#otp'
         ]
-        
-        for selector in otp_indicators:
-            try:
-                await self.page.wait_for_selector(selector, timeout=2000)
-                return True
-            except:
-                continue
-        return False
+        return await self._wait_any(otp_indicators, 2000) is not None
     
     async def handle_otp(self) -> bool:
         try:
-            logging.info("OTP handling - waiting for manual input or automation")
-            
-            await self.page.wait_for_timeout(5000)
-            
+            logger.info("OTP handling - waiting for manual input or automation")
+
             otp_input_selectors = [
                 'input[placeholder*="OTP"]',
                 'input[placeholder*="otp"]',
@@ -210,88 +395,126 @@ class JagritiBrowserClient:
                 '.otp-input',
                 '#otp'
             ]
-            
-            otp_input_found = False
-            for selector in otp_input_selectors:
+
+            selector = await self._wait_any(otp_input_selectors, 10000)
+            if selector is None:
+                logger.error("OTP input field not found")
+                return False
+            logger.info("OTP input found: %s", selector)
+
+            logger.info("Please enter OTP manually in the browser or implement OTP service integration")
+
+            # Event-driven instead of a 30x2s polling loop: the page
+            # wakes us the moment the field holds a plausible OTP.
+            try:
+                await self.page.wait_for_function(
+                    '''sel => {
+                        const el = document.querySelector(sel);
+                        return !!(el && el.value && el.value.length >= 4);
+                    }''',
+                    arg=selector,
+                    timeout=60000
+                )
+            except Exception:
+                logger.error("No OTP entered within timeout")
+                return False
+
+            submit_selectors = [
+                'button[type="submit"]',
+                'button:has-text("Verify")',
+                'button:has-text("Submit")',
+                '.verify-btn'
+            ]
+
+            for submit_selector in submit_selectors:
                 try:
-                    element = await self.page.query_selector(selector)
-                    if element:
-                        otp_input_found = True
-                        logging.info(f"OTP input found: {selector}")
-                        
-                        logging.info("Please enter OTP manually in the browser or implement OTP service integration")
-                        
-                        for attempt in range(30):
-                            await self.page.wait_for_timeout(2000)
-                            value = await element.get_attribute('value')
-                            if value and len(value) >= 4:
-                                submit_selectors = [
-                                    'button[type="submit"]',
-                                    'button:has-text("Verify")',
-                                    'button:has-text("Submit")',
-                                    '.verify-btn'
-                                ]
-                                
-                                for submit_selector in submit_selectors:
-                                    try:
-                                        await self.page.click(submit_selector)
-                                        break
-                                    except:
-                                        continue
-                                
-                                await self.page.wait_for_timeout(3000)
-                                current_url = self.page.url
-                                if 'dashboard' in current_url or 'home' in current_url:
-                                    self.authenticated = True
-                                    return True
-                        break
+                    await self.page.click(submit_selector)
+                    break
                 except:
                     continue
-            
-            if not otp_input_found:
-                logging.error("OTP input field not found")
+
+            try:
+                await self.page.wait_for_url(
+                    lambda url: 'dashboard' in url or 'home' in url,
+                    timeout=15000
+                )
+            except Exception:
+                logger.error("OTP verification did not reach the dashboard")
                 return False
-                
-            return False
-            
+
+            self.authenticated = True
+            await self._save_auth_state()
+            return True
+
         except Exception as e:
-            logging.error(f"OTP handling error: {e}")
+            logger.error("OTP handling error: %s", e)
             return False
     
+    async def _wait_for_search_form(self):
+        # Wait for the form's dropdowns to actually render instead of
+        # sleeping a fixed interval; the happy path continues as soon as
+        # the page is ready rather than after a worst-case delay.
+        try:
+            await self.page.wait_for_selector('select', timeout=10000)
+        except Exception:
+            logger.debug("Search form selects did not appear within timeout")
+
+    async def _extract_options(self, selector: str) -> List:
+        # Per-option get_attribute/text_content calls each cost a
+        # protocol round-trip (2N for an N-option dropdown); one
+        # evaluate returns the whole list in a single trip.
+        return await self.page.evaluate(
+            '''sel => Array.from(document.querySelectorAll(sel + ' option'))
+                .map(o => [o.value.trim(), (o.textContent || '').trim()])
+                .filter(([value, text]) => value && text)''',
+            selector
+        )
+
     async def navigate_to_advance_search(self) -> bool:
         try:
             if not self.authenticated:
-                logging.error("Not authenticated")
+                logger.error("Not authenticated")
                 return False
             
-            search_links = [
+            search_css = ('a[href*="advance-search"], a[href*="advanced-search"], '
+                          '.advance-search, #advanceSearch')
+            search_text_selectors = [
                 'text="Advance Search"',
-                'text="Advanced Search"', 
-                'a[href*="advance-search"]',
-                'a[href*="advanced-search"]',
-                '.advance-search',
-                '#advanceSearch'
+                'text="Advanced Search"'
             ]
-            
-            for selector in search_links:
+
+            try:
+                await self.page.click(search_css, timeout=5000)
+                logger.info("Clicked advance search via CSS candidates")
+                await self._wait_for_search_form()
+                return True
+            except Exception:
+                pass
+
+            for selector in search_text_selectors:
                 try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    await self.page.click(selector)
-                    logging.info(f"Clicked advance search with selector: {selector}")
-                    await self.page.wait_for_timeout(3000)
+                    await self.page.click(selector, timeout=2000)
+                    logger.info("Clicked advance search with selector: %s", selector)
+                    await self._wait_for_search_form()
                     return True
                 except:
                     continue
-            
+
             await self.page.goto(f"{settings.JAGRITI_BASE_URL}/advance-case-search")
-            await self.page.wait_for_timeout(3000)
+            await self._wait_for_search_form()
             return True
             
         except Exception as e:
-            logging.error(f"Navigate to advance search error: {e}")
+            logger.error("Navigate to advance search error: %s", e)
             return False
     
     async def extract_states(self) -> List[Dict]:
+        # The client drives one shared page; serialize callers so
+        # concurrent navigations don't interleave.
+        async with self._page_lock:
+            return await self._extract_states()
+
+    async def _extract_states(self) -> List[Dict]:
         try:
             await self.navigate_to_advance_search()
             
@@ -305,42 +528,42 @@ class JagritiBrowserClient:
             for selector in state_selectors:
                 try:
                     await self.page.wait_for_selector(selector, timeout=10000)
-                    options = await self.page.query_selector_all(f"{selector} option")
-                    
-                    states = []
-                    for option in options:
-                        value = await option.get_attribute('value')
-                        text = await option.text_content()
-                        
-                        if value and text and value != '' and text.strip():
-                            states.append({
-                                'id': value.strip(),
-                                'name': text.strip().upper(),
-                                'display_name': text.strip()
-                            })
-                    
+                    rows = await self._extract_options(selector)
+
+                    states = [
+                        {
+                            'id': value,
+                            'name': text.upper(),
+                            'display_name': text
+                        }
+                        for value, text in rows
+                    ]
+
                     if states:
-                        logging.info(f"Extracted {len(states)} states")
+                        logger.info("Extracted %s states", len(states))
                         return states
-                        
+
                 except Exception as e:
-                    logging.debug(f"State selector {selector} failed: {e}")
+                    logger.debug("State selector %s failed: %s", selector, e)
                     continue
             
-            logging.error("Could not extract states")
+            logger.error("Could not extract states")
             return []
             
         except Exception as e:
-            logging.error(f"Extract states error: {e}")
+            logger.error("Extract states error: %s", e)
             return []
     
     async def extract_commissions(self, state_id: str) -> List[Dict]:
+        async with self._page_lock:
+            return await self._extract_commissions(state_id)
+
+    async def _extract_commissions(self, state_id: str) -> List[Dict]:
         try:
             await self.navigate_to_advance_search()
             
-            state_select = await self.page.query_selector('select[name="state"], select#state, .state-select')
-            if state_select:
-                await state_select.select_option(state_id)
+            if await self.loc_state_select.count():
+                await self.loc_state_select.first.select_option(state_id)
                 await self.page.wait_for_timeout(2000)
             
             commission_selectors = [
@@ -352,47 +575,64 @@ class JagritiBrowserClient:
             for selector in commission_selectors:
                 try:
                     await self.page.wait_for_selector(selector, timeout=10000)
-                    options = await self.page.query_selector_all(f"{selector} option")
-                    
-                    commissions = []
-                    for option in options:
-                        value = await option.get_attribute('value')
-                        text = await option.text_content()
-                        
-                        if value and text and value != '' and text.strip():
-                            commissions.append({
-                                'id': value.strip(),
-                                'name': text.strip(),
-                                'display_name': text.strip(),
-                                'state_id': state_id
-                            })
-                    
+                    rows = await self._extract_options(selector)
+
+                    commissions = [
+                        {
+                            'id': value,
+                            'name': text,
+                            'display_name': text,
+                            'state_id': state_id
+                        }
+                        for value, text in rows
+                    ]
+
                     if commissions:
-                        logging.info(f"Extracted {len(commissions)} commissions for state {state_id}")
+                        logger.info("Extracted %s commissions for state %s", len(commissions), state_id)
                         return commissions
-                        
+
                 except Exception as e:
-                    logging.debug(f"Commission selector {selector} failed: {e}")
+                    logger.debug("Commission selector %s failed: %s", selector, e)
                     continue
             
             return []
             
         except Exception as e:
-            logging.error(f"Extract commissions error: {e}")
+            logger.error("Extract commissions error: %s", e)
             return []
     
+    async def extract_all_commissions(self, states: List[Dict]) -> Dict[str, List[Dict]]:
+        # One pooled browser, one context per task: contexts are cheap
+        # and give each worker its own page, so the per-state extractions
+        # can't collide on select_option state.
+        sem = asyncio.Semaphore(8)
+        results: Dict[str, List[Dict]] = {}
+
+        async def one(state_id: str):
+            async with sem:
+                worker = JagritiBrowserClient()
+                async with pool.acquire_context() as context:
+                    await worker._bind_page(context)
+                    worker.authenticated = self.authenticated
+                    results[state_id] = await worker._extract_commissions(state_id)
+
+        await asyncio.gather(*(one(state['id']) for state in states))
+        return results
+
     async def search_cases(self, search_params: Dict) -> List[Dict]:
+        async with self._page_lock:
+            return await self._search_cases(search_params)
+
+    async def _search_cases(self, search_params: Dict) -> List[Dict]:
         try:
             await self.navigate_to_advance_search()
             
-            state_select = await self.page.query_selector('select[name="state"], select#state')
-            if state_select:
-                await state_select.select_option(search_params.get('state_id', ''))
+            if await self.loc_state_select.count():
+                await self.loc_state_select.first.select_option(search_params.get('state_id', ''))
                 await self.page.wait_for_timeout(1000)
-            
-            commission_select = await self.page.query_selector('select[name="commission"], select#commission')
-            if commission_select:
-                await commission_select.select_option(search_params.get('commission_id', ''))
+
+            if await self.loc_commission_select.count():
+                await self.loc_commission_select.first.select_option(search_params.get('commission_id', ''))
                 await self.page.wait_for_timeout(1000)
             
             search_type = search_params.get('search_type', 'complainant')
@@ -437,54 +677,21 @@ class JagritiBrowserClient:
                 except:
                     continue
             
-            await self.page.wait_for_timeout(5000)
-            
+            # The table wait below is already event-driven; no need for a
+            # fixed sleep in front of it.
             table_selector = 'table, .table, .results-table, #resultsTable'
             await self.page.wait_for_selector(table_selector, timeout=15000)
             
-            cases = await self.page.evaluate('''
-                () => {
-                    const cases = [];
-                    const tables = document.querySelectorAll('table');
-                    
-                    for (const table of tables) {
-                        const rows = table.querySelectorAll('tbody tr, tr:not(:first-child)');
-                        
-                        for (const row of rows) {
-                            const cells = row.querySelectorAll('td, th');
-                            if (cells.length >= 6) {
-                                const caseData = {
-                                    case_number: cells[0]?.textContent?.trim() || '',
-                                    case_stage: cells[1]?.textContent?.trim() || '',
-                                    filing_date: cells[2]?.textContent?.trim() || '',
-                                    complainant: cells[3]?.textContent?.trim() || '',
-                                    complainant_advocate: cells[4]?.textContent?.trim() || '',
-                                    respondent: cells[5]?.textContent?.trim() || '',
-                                    respondent_advocate: cells[6]?.textContent?.trim() || '',
-                                    document_link: ''
-                                };
-                                
-                                const linkElement = cells[cells.length - 1]?.querySelector('a');
-                                if (linkElement) {
-                                    caseData.document_link = linkElement.href;
-                                }
-                                
-                                if (caseData.case_number) {
-                                    cases.push(caseData);
-                                }
-                            }
-                        }
-                        
-                        if (cases.length > 0) break;
-                    }
-                    
-                    return cases;
-                }
-            ''')
-            
-            logging.info(f"Extracted {len(cases)} cases from search results")
+            # Walking the table in-page means serializing a JS closure,
+            # running it under the page's event loop and marshalling the
+            # result back; pulling the HTML once and parsing it with the
+            # shared lxml walker keeps the renderer free.
+            html = await self.page.content()
+            cases = parse_cases_from_html(html)
+
+            logger.info("Extracted %s cases from search results", len(cases))
             return cases
             
         except Exception as e:
-            logging.error(f"Search cases error: {e}")
+            logger.error("Search cases error: %s", e)
             return []
\ No newline at end of file
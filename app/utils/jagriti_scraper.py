@@ -1,43 +1,419 @@
+import asyncio
 import httpx
-import requests
 import logging
+import orjson
+import random
 import re
+import socket
 import time
+from email.utils import parsedate_to_datetime
+from functools import cached_property
+from types import MappingProxyType
 from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from urllib.parse import urljoin
 from app.core.config import settings
+from app.core.exceptions import RateLimitExceededException
+
+logger = logging.getLogger(__name__)
+
+_STATE_ATTR_RE = re.compile(r'state', re.I)
+_COMMISSION_ATTR_RE = re.compile(r'commission', re.I)
+
+# Matches the csrf-token <input>/<meta> tag with either attribute order,
+# so the landing page never needs a full DOM build just for one token.
+# A bytes pattern run over response.content spares the full-body UTF-8
+# decode that response.text would pay on a half-megabyte page.
+_CSRF_RE = re.compile(
+    rb'name=["\']csrf-token["\'][^>]*?(?:value|content)=["\']([^"\']+)'
+    rb'|(?:value|content)=["\']([^"\']+)["\'][^>]*?name=["\']csrf-token["\']',
+    re.I
+)
+
+_SEARCH_FIELD_MAP = MappingProxyType({
+    'case_number': 'caseNumber',
+    'complainant': 'complainantName',
+    'respondent': 'respondentName',
+    'complainant_advocate': 'complainantAdvocate',
+    'respondent_advocate': 'respondentAdvocate',
+    'judge': 'judgeName',
+    'industry_type': 'industryType'
+})
+
+_BASE_SEARCH_DATA = MappingProxyType({
+    'commissionType': 'DCDRC',
+    'fromDate': '01/01/2024',
+    'toDate': '31/12/2025',
+    'orderType': 'DAILY ORDER',
+    'dateType': 'filing'
+})
+
+
+# Compiled once: lxml re-parses XPath strings on every .xpath() call,
+# which adds up over thousand-row result tables.
+_ROWS_XPATH = etree.XPath('.//tr')
+_CELLS_XPATH = etree.XPath('td|th')
+_FIRST_LINK_XPATH = etree.XPath('.//a[1]')
+
+# Endpoint probes race in parallel, so each one can afford a short
+# timeout without inflating worst-case latency.
+_PROBE_TIMEOUT = 5.0
+
+
+async def _probe_first(requests, accept):
+    # Fire every candidate endpoint at once and keep the first response
+    # the accept() callback turns into usable rows; losers are cancelled
+    # so total wall time is max(RTT) instead of the sum of timeouts.
+    # Returns (winning label, result) so callers can remember the winner.
+    tasks = {asyncio.create_task(coro): label for label, coro in requests}
+    try:
+        while tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                label = tasks.pop(task)
+                try:
+                    result = accept(task.result())
+                except Exception as e:
+                    logger.debug("Endpoint %s failed: %s", label, e)
+                    continue
+                if result:
+                    return label, result
+        return None
+    finally:
+        # A task that finished in the same wait() wake-up as the winner
+        # is never examined above; cancel() is a no-op on it, and its
+        # unretrieved exception would be dumped to the log by the event
+        # loop. Consume those before cancelling the still-pending rest.
+        for task in tasks:
+            if task.done():
+                task.exception()
+            else:
+                task.cancel()
+
+
+def _matching_selects(doc, attr_re) -> List:
+    selects = []
+    for select in doc.iter('select'):
+        if (attr_re.search(select.get('name', '')) or
+                attr_re.search(select.get('id', '')) or
+                attr_re.search(select.get('class', ''))):
+            selects.append(select)
+    return selects
+
+
+# Field aliases seen across the portal's JSON APIs, ordered so the
+# common camelCase spelling short-circuits first.
+_ID_ALIASES = ('commissionId', 'stateId', 'id', 'code')
+_NAME_ALIASES = ('commissionNameEn', 'stateNameEn', 'name')
+
+# Case-row fields as (output key, camelCase spelling, snake_case
+# fallback); one flat tuple scan per row beats eight nested .get pairs.
+_CASE_FIELD_MAP = (
+    ('case_number', 'caseNumber', 'case_number'),
+    ('case_stage', 'caseStage', 'stage'),
+    ('filing_date', 'filingDate', 'filing_date'),
+    ('complainant', 'complainantName', 'complainant'),
+    ('complainant_advocate', 'complainantAdvocate', 'complainant_advocate'),
+    ('respondent', 'respondentName', 'respondent'),
+    ('respondent_advocate', 'respondentAdvocate', 'respondent_advocate'),
+    ('document_link', 'documentLink', 'document_link'),
+)
+
+
+def _looks_like_json(content: bytes) -> bool:
+    # Cheap structural sniff before handing a body to orjson: HTML
+    # fallback pages would otherwise pay a raised-and-caught decode
+    # exception on every probe, and exceptions are the expensive path.
+    head = content[:32].lstrip()
+    return head[:1] in (b'{', b'[')
+
+
+def _pick(item: Dict, aliases) -> Optional[str]:
+    return next((item[k] for k in aliases if k in item), None)
+
+
+def _parse_json_entries(payload, state_id: Optional[str] = None) -> List[Dict]:
+    # The portal's React front-end consumes JSON APIs whose rows appear
+    # either as a bare list or under a "data" key, with camelCase ids.
+    if isinstance(payload, dict):
+        payload = payload.get('data', [])
+    if not isinstance(payload, list):
+        return []
+
+    entries = []
+    for item in payload:
+        if not isinstance(item, dict):
+            continue
+        entry_id = _pick(item, _ID_ALIASES)
+        name = _pick(item, _NAME_ALIASES)
+        if entry_id and name:
+            entry = {
+                'id': str(entry_id),
+                'name': str(name).upper(),
+                'display_name': str(name)
+            }
+            if state_id is not None:
+                entry['state_id'] = state_id
+            entries.append(entry)
+    return entries
+
+
+def _format_date(date_str: str) -> str:
+    # Fixed DD/MM/YYYY -> YYYY-MM-DD mapping; slicing beats strptime's
+    # regex machinery by an order of magnitude per row.
+    if len(date_str) == 10 and date_str[2] == '/' and date_str[5] == '/':
+        return f"{date_str[6:10]}-{date_str[3:5]}-{date_str[0:2]}"
+    return date_str
+
+
+def parse_cases_from_html(html: str) -> List[Dict]:
+    # Shared by the HTTP scraper and the browser client: the browser
+    # hands over page.content() and the table is walked here with lxml
+    # instead of an in-page JS evaluate.
+    cases = []
+    try:
+        doc = lxml.html.fromstring(html)
+
+        for table in doc.iter('table'):
+            rows = _ROWS_XPATH(table)
+
+            if len(rows) > 1:
+                for row in rows[1:]:
+                    cells = _CELLS_XPATH(row)
+                    if len(cells) >= 6:
+                        texts = [cell.text_content().strip() for cell in cells]
+                        case_data = {
+                            'case_number': texts[0],
+                            'case_stage': texts[1],
+                            'filing_date': _format_date(texts[2]),
+                            'complainant': texts[3],
+                            'complainant_advocate': texts[4],
+                            'respondent': texts[5],
+                            'respondent_advocate': texts[6] if len(texts) > 6 else '',
+                            'document_link': ''
+                        }
+
+                        link_cell = cells[-1] if len(cells) > 7 else cells[0]
+                        links = _FIRST_LINK_XPATH(link_cell)
+                        link = links[0] if links else None
+                        if link is not None and link.get('href'):
+                            case_data['document_link'] = urljoin(settings.JAGRITI_BASE_URL, link.get('href'))
+
+                        if case_data['case_number']:
+                            cases.append(case_data)
+
+                if cases:
+                    break
+
+        logger.info("Parsed %s cases from real HTML", len(cases))
+        return cases
+
+    except Exception as e:
+        logger.error("HTML parsing failed: %s", e)
+        return []
+
+
+# Placeholder values the portal uses for "choose one" entries; shared
+# frozenset so the per-option filter is one O(1) probe, not a fresh
+# list literal scanned linearly each iteration.
+_EXCLUDED_OPTION_VALUES = frozenset({'', '-1', '0', 'select'})
+
+
+def _extract_options(select, extra: Optional[Dict] = None) -> List[Dict]:
+    entries = []
+    for option in select.iter('option'):
+        value = (option.get('value') or '').strip()
+        text = option.text_content().strip()
+
+        if value and text and value not in _EXCLUDED_OPTION_VALUES:
+            entry = {'id': value, 'name': text, 'display_name': text}
+            if extra:
+                entry.update(extra)
+            entries.append(entry)
+    return entries
+
+
+# Never idle longer than this on a 429, whatever the server claims.
+_RETRY_DELAY_CAP = 60.0
+
+
+def _retry_delay(response, attempt: int) -> float:
+    # Prefer the server's own Retry-After (seconds or HTTP-date form);
+    # otherwise back off exponentially. Jitter keeps concurrent workers
+    # from retrying in lockstep.
+    delay = None
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        retry_after = retry_after.strip()
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            try:
+                delay = max(
+                    0.0, parsedate_to_datetime(retry_after).timestamp() - time.time()
+                )
+            except (TypeError, ValueError):
+                pass
+    if delay is None:
+        delay = 2.0 ** attempt
+    delay += random.uniform(0, delay * 0.25)
+    return min(delay, _RETRY_DELAY_CAP)
+
+
+class _TokenBucket:
+    # Steady-state pacing toward the portal with burst absorption: a
+    # plain inter-request sleep gated on a shared timestamp makes
+    # concurrent coroutines all read the same stale value and sleep in
+    # lockstep, so bursts slip through anyway. Token accounting under a
+    # lock allows up to `capacity` immediate requests and then refills
+    # at `rate` per second.
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            # Going negative records the debt, so concurrent waiters
+            # space themselves 1/rate apart instead of piling up.
+            wait = (1 - self._tokens) / self._rate
+            self._tokens -= 1
+        await asyncio.sleep(wait)
 
 
 class JagritiRealClient:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        })
+        self.session = httpx.AsyncClient(
+            timeout=settings.JAGRITI_TIMEOUT,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=settings.JAGRITI_MAX_RETRIES,
+                limits=httpx.Limits(
+                    max_connections=settings.MAX_CONCURRENT_REQUESTS * 4,
+                    max_keepalive_connections=settings.MAX_CONCURRENT_REQUESTS * 2,
+                    keepalive_expiry=30.0
+                ),
+                # Commission lists for big states run to megabytes; a 4MB
+                # receive buffer drains them in far fewer reads.
+                socket_options=[(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)]
+            ),
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Upgrade-Insecure-Requests': '1'
+            }
+        )
         self.csrf_token = None
-        
-    def get_session_data(self):
-        try:
-            response = self.session.get(settings.JAGRITI_BASE_URL, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            csrf_input = soup.find('input', {'name': 'csrf-token'}) or soup.find('meta', {'name': 'csrf-token'})
-            if csrf_input:
-                self.csrf_token = csrf_input.get('value') or csrf_input.get('content')
-                
+        self._session_lock = asyncio.Lock()
+        self._winning_search_endpoint: Optional[str] = None
+        # Racing probes plus snapshot warmup can otherwise burst well
+        # past what the portal tolerates; cap outbound requests below
+        # the pool size so probes queue instead of starving the pool.
+        self._request_sem = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+        self._bucket = _TokenBucket(
+            rate=1.0 / settings.REQUEST_DELAY,
+            capacity=settings.MAX_CONCURRENT_REQUESTS
+        )
+
+    async def _send(self, method, url: str, **kwargs):
+        for attempt in range(settings.JAGRITI_MAX_RETRIES + 1):
+            async with self._request_sem:
+                await self._bucket.acquire()
+                response = await method(url, **kwargs)
+            if response.status_code != 429:
+                return response
+            if attempt == settings.JAGRITI_MAX_RETRIES:
+                break
+            delay = _retry_delay(response, attempt)
+            logger.warning("Portal rate-limited %s; retrying in %.1fs", url, delay)
+            await asyncio.sleep(delay)
+        raise RateLimitExceededException(f"Rate limited by portal on {url}")
+
+    async def _get(self, url: str, **kwargs):
+        return await self._send(self.session.get, url, **kwargs)
+
+    async def _post(self, url: str, **kwargs):
+        return await self._send(self.session.post, url, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.session.aclose()
+
+    def _harvest_csrf(self, body: bytes):
+        match = _CSRF_RE.search(body)
+        if match:
+            self.csrf_token = (match.group(1) or match.group(2)).decode('ascii', 'replace')
+
+    async def get_session_data(self):
+        # Cookies ride the persistent client's jar, so once a token is
+        # on hand there is nothing left to initialize. The lock makes
+        # cold-start init single-flight: concurrent callers wait on the
+        # first fetch instead of each issuing their own landing-page GET.
+        if self.csrf_token:
             return True
-        except Exception as e:
-            logging.error(f"Failed to get session data: {e}")
-            return False
+        async with self._session_lock:
+            if self.csrf_token:
+                return True
+            try:
+                response = await self._get(settings.JAGRITI_BASE_URL)
+                response.raise_for_status()
+                self._harvest_csrf(response.content)
+                return True
+            except Exception as e:
+                logger.error("Failed to get session data: %s", e)
+                return False
     
-    def extract_states_from_page(self) -> List[Dict]:
+    async def extract_states_json(self) -> List[Dict]:
+        json_endpoints = [
+            f"{settings.JAGRITI_BASE_URL}/services/report/report/getStateCommissionAndCircuitBench",
+            f"{settings.JAGRITI_BASE_URL}/services/master/master/getStates",
+            f"{settings.JAGRITI_BASE_URL}/api/states"
+        ]
+
+        def accept(response):
+            if response.status_code != 200:
+                return None
+            # Parsing the bytes directly is cheaper than sniffing the
+            # content-type header and copes with misdeclared charsets;
+            # HTML bodies simply fail the structural sniff.
+            if not _looks_like_json(response.content):
+                return None
+            try:
+                return _parse_json_entries(orjson.loads(response.content))
+            except orjson.JSONDecodeError:
+                return None
+
+        won = await _probe_first(
+            [(ep, self._get(ep, timeout=_PROBE_TIMEOUT)) for ep in json_endpoints],
+            accept
+        )
+        if won:
+            _, states = won
+            logger.info("Extracted %s states from JSON API", len(states))
+            return states
+        return []
+
+    async def extract_states_from_page(self) -> List[Dict]:
         try:
             advance_search_urls = [
                 f"{settings.JAGRITI_BASE_URL}/advance-case-search",
@@ -45,112 +421,83 @@ class JagritiRealClient:
                 f"{settings.JAGRITI_BASE_URL}/search"
             ]
             
-            for url in advance_search_urls:
-                try:
-                    response = self.session.get(url, timeout=30)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        state_selects = soup.find_all('select', {'name': re.compile(r'state', re.I)})
-                        if not state_selects:
-                            state_selects = soup.find_all('select', id=re.compile(r'state', re.I))
-                        if not state_selects:
-                            state_selects = soup.find_all('select', class_=re.compile(r'state', re.I))
-                        
-                        for select in state_selects:
-                            options = select.find_all('option')
-                            states = []
-                            
-                            for option in options:
-                                value = option.get('value', '').strip()
-                                text = option.get_text(strip=True)
-                                
-                                if value and text and value not in ['', '-1', '0', 'select']:
-                                    states.append({
-                                        'id': value,
-                                        'name': text.upper(),
-                                        'display_name': text
-                                    })
-                            
-                            if states:
-                                logging.info(f"Extracted {len(states)} states from real portal")
-                                return states
-                                
-                except Exception as e:
-                    logging.debug(f"Failed to fetch from {url}: {e}")
-                    continue
-                    
+            def accept(response):
+                if response.status_code != 200:
+                    return None
+                # These are the same pages the standalone session GET
+                # would fetch, so grab the CSRF token while we're here
+                # and spare the cold path an extra round trip.
+                if not self.csrf_token:
+                    self._harvest_csrf(response.content)
+                doc = lxml.html.fromstring(response.content)
+
+                for select in _matching_selects(doc, _STATE_ATTR_RE):
+                    states = _extract_options(select)
+                    if states:
+                        for state in states:
+                            state['name'] = state['name'].upper()
+                        return states
+                return None
+
+            won = await _probe_first(
+                [(url, self._get(url, timeout=_PROBE_TIMEOUT)) for url in advance_search_urls],
+                accept
+            )
+            if won:
+                _, states = won
+                logger.info("Extracted %s states from real portal", len(states))
+                return states
             return []
-            
+
         except Exception as e:
-            logging.error(f"Failed to extract states: {e}")
+            logger.error("Failed to extract states: %s", e)
             return []
     
-    def extract_commissions_for_state(self, state_id: str) -> List[Dict]:
+    async def extract_commissions_for_state(self, state_id: str) -> List[Dict]:
         try:
+            if not self.csrf_token:
+                await self.get_session_data()
             commission_endpoints = [
                 f"{settings.JAGRITI_BASE_URL}/api/commissions",
                 f"{settings.JAGRITI_BASE_URL}/ajax/getCommissions",
                 f"{settings.JAGRITI_BASE_URL}/services/commissions"
             ]
             
-            for endpoint in commission_endpoints:
-                try:
-                    data = {'state_id': state_id, 'state': state_id}
-                    if self.csrf_token:
-                        data['csrf-token'] = self.csrf_token
-                    
-                    response = self.session.post(endpoint, data=data, timeout=30)
-                    
-                    if response.status_code == 200:
-                        if response.headers.get('content-type', '').startswith('application/json'):
-                            json_data = response.json()
-                            if isinstance(json_data, list):
-                                commissions = []
-                                for item in json_data:
-                                    if isinstance(item, dict) and 'id' in item and 'name' in item:
-                                        commissions.append({
-                                            'id': str(item['id']),
-                                            'name': item['name'],
-                                            'display_name': item['name'],
-                                            'state_id': state_id
-                                        })
-                                return commissions
-                        else:
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            commission_selects = soup.find_all('select', {'name': re.compile(r'commission', re.I)})
-                            
-                            for select in commission_selects:
-                                options = select.find_all('option')
-                                commissions = []
-                                
-                                for option in options:
-                                    value = option.get('value', '').strip()
-                                    text = option.get_text(strip=True)
-                                    
-                                    if value and text and value not in ['', '-1', '0', 'select']:
-                                        commissions.append({
-                                            'id': value,
-                                            'name': text,
-                                            'display_name': text,
-                                            'state_id': state_id
-                                        })
-                                
-                                if commissions:
-                                    return commissions
-                                    
-                except Exception as e:
-                    logging.debug(f"Commission endpoint {endpoint} failed: {e}")
-                    continue
-            
-            return []
-            
+            data = {'state_id': state_id, 'state': state_id}
+            if self.csrf_token:
+                data['csrf-token'] = self.csrf_token
+
+            def accept(response):
+                if response.status_code != 200:
+                    return None
+                if _looks_like_json(response.content):
+                    try:
+                        return _parse_json_entries(orjson.loads(response.content), state_id)
+                    except orjson.JSONDecodeError:
+                        pass
+
+                doc = lxml.html.fromstring(response.content)
+                for select in _matching_selects(doc, _COMMISSION_ATTR_RE):
+                    commissions = _extract_options(select, {'state_id': state_id})
+                    if commissions:
+                        return commissions
+                return None
+
+            won = await _probe_first(
+                [(ep, self._post(ep, data=data, timeout=_PROBE_TIMEOUT))
+                 for ep in commission_endpoints],
+                accept
+            )
+            return won[1] if won else []
+
         except Exception as e:
-            logging.error(f"Failed to extract commissions: {e}")
+            logger.error("Failed to extract commissions: %s", e)
             return []
     
-    def search_cases_real(self, params: Dict) -> List[Dict]:
+    async def search_cases_real(self, params: Dict) -> List[Dict]:
         try:
+            if not self.csrf_token:
+                await self.get_session_data()
             search_endpoints = [
                 f"{settings.JAGRITI_BASE_URL}/advance-search",
                 f"{settings.JAGRITI_BASE_URL}/case-search",
@@ -158,208 +505,212 @@ class JagritiRealClient:
             ]
             
             search_data = {
-                'commissionType': 'DCDRC',
+                **_BASE_SEARCH_DATA,
                 'state': params.get('state', ''),
                 'stateId': params.get('state_id', ''),
                 'commission': params.get('commission', ''),
-                'commissionId': params.get('commission_id', ''),
-                'fromDate': '01/01/2024',
-                'toDate': '31/12/2025',
-                'orderType': 'DAILY ORDER',
-                'dateType': 'filing'
+                'commissionId': params.get('commission_id', '')
             }
-            
-            search_type = params.get('search_type', 'complainant')
-            search_value = params.get('search_value', '')
-            
-            field_mapping = {
-                'case_number': 'caseNumber',
-                'complainant': 'complainantName',
-                'respondent': 'respondentName',
-                'complainant_advocate': 'complainantAdvocate',
-                'respondent_advocate': 'respondentAdvocate',
-                'judge': 'judgeName',
-                'industry_type': 'industryType'
-            }
-            
-            if search_type in field_mapping:
-                search_data[field_mapping[search_type]] = search_value
-                
+
+            field = _SEARCH_FIELD_MAP.get(params.get('search_type', 'complainant'))
+            if field:
+                search_data[field] = params.get('search_value', '')
+
             if self.csrf_token:
                 search_data['csrf-token'] = self.csrf_token
-            
-            for endpoint in search_endpoints:
+
+            def accept(response):
+                if response.status_code != 200:
+                    return None
+                if _looks_like_json(response.content):
+                    try:
+                        json_data = orjson.loads(response.content)
+                    except orjson.JSONDecodeError:
+                        return self.parse_html_cases(response.text)
+                    if isinstance(json_data, dict) and 'cases' in json_data:
+                        return self.parse_json_cases(json_data['cases'])
+                    return None
+                return self.parse_html_cases(response.text)
+
+            # MRU fast path: the endpoint that worked last time almost
+            # always works again, so try it alone before racing the list.
+            if self._winning_search_endpoint:
                 try:
-                    response = self.session.post(endpoint, data=search_data, timeout=30)
-                    
-                    if response.status_code == 200:
-                        if 'application/json' in response.headers.get('content-type', ''):
-                            json_data = response.json()
-                            if 'cases' in json_data:
-                                return self.parse_json_cases(json_data['cases'])
-                        else:
-                            return self.parse_html_cases(response.text)
-                            
+                    cases = accept(await self._post(
+                        self._winning_search_endpoint, data=search_data,
+                        timeout=_PROBE_TIMEOUT
+                    ))
+                    if cases:
+                        return cases
                 except Exception as e:
-                    logging.debug(f"Search endpoint {endpoint} failed: {e}")
-                    continue
-            
+                    logger.debug(
+                        "Previous winning endpoint %s failed: %s",
+                        self._winning_search_endpoint, e
+                    )
+                self._winning_search_endpoint = None
+
+            won = await _probe_first(
+                [(ep, self._post(ep, data=search_data, timeout=_PROBE_TIMEOUT))
+                 for ep in search_endpoints],
+                accept
+            )
+            if won:
+                self._winning_search_endpoint, cases = won
+                return cases
             return []
-            
+
         except Exception as e:
-            logging.error(f"Real case search failed: {e}")
+            logger.error("Real case search failed: %s", e)
             return []
     
     def parse_html_cases(self, html: str) -> List[Dict]:
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            cases = []
-            
-            tables = soup.find_all('table')
-            for table in tables:
-                rows = table.find_all('tr')
-                
-                if len(rows) > 1:
-                    for row in rows[1:]:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) >= 6:
-                            case_data = {
-                                'case_number': cells[0].get_text(strip=True),
-                                'case_stage': cells[1].get_text(strip=True) if len(cells) > 1 else '',
-                                'filing_date': cells[2].get_text(strip=True) if len(cells) > 2 else '',
-                                'complainant': cells[3].get_text(strip=True) if len(cells) > 3 else '',
-                                'complainant_advocate': cells[4].get_text(strip=True) if len(cells) > 4 else '',
-                                'respondent': cells[5].get_text(strip=True) if len(cells) > 5 else '',
-                                'respondent_advocate': cells[6].get_text(strip=True) if len(cells) > 6 else '',
-                                'document_link': ''
-                            }
-                            
-                            link_cell = cells[-1] if len(cells) > 7 else cells[0]
-                            link = link_cell.find('a')
-                            if link and link.get('href'):
-                                href = link.get('href')
-                                case_data['document_link'] = urljoin(settings.JAGRITI_BASE_URL, href)
-                            
-                            if case_data['case_number']:
-                                cases.append(case_data)
-                    
-                    if cases:
-                        break
-            
-            logging.info(f"Parsed {len(cases)} cases from real HTML")
-            return cases
-            
-        except Exception as e:
-            logging.error(f"HTML parsing failed: {e}")
-            return []
-    
+        return parse_cases_from_html(html)
+
     def parse_json_cases(self, cases_data: List) -> List[Dict]:
         cases = []
         try:
             for case in cases_data:
                 if isinstance(case, dict):
                     case_data = {
-                        'case_number': case.get('caseNumber', case.get('case_number', '')),
-                        'case_stage': case.get('caseStage', case.get('stage', '')),
-                        'filing_date': case.get('filingDate', case.get('filing_date', '')),
-                        'complainant': case.get('complainantName', case.get('complainant', '')),
-                        'complainant_advocate': case.get('complainantAdvocate', case.get('complainant_advocate', '')),
-                        'respondent': case.get('respondentName', case.get('respondent', '')),
-                        'respondent_advocate': case.get('respondentAdvocate', case.get('respondent_advocate', '')),
-                        'document_link': case.get('documentLink', case.get('document_link', ''))
+                        out: case.get(primary) or case.get(fallback, '')
+                        for out, primary, fallback in _CASE_FIELD_MAP
                     }
+                    case_data['filing_date'] = _format_date(case_data['filing_date'])
                     cases.append(case_data)
         except Exception as e:
-            logging.error(f"JSON parsing failed: {e}")
-        
+            logger.error("JSON parsing failed: %s", e)
+
         return cases
 
 
+# (id, NAME, Display Name) triples for when the portal is down;
+# materialized into dicts lazily since the common path never needs them.
+_FALLBACK_STATES_RAW = (
+    ('AP', 'ANDHRA PRADESH', 'Andhra Pradesh'),
+    ('AS', 'ASSAM', 'Assam'),
+    ('BR', 'BIHAR', 'Bihar'),
+    ('CG', 'CHHATTISGARH', 'Chhattisgarh'),
+    ('DL', 'DELHI', 'Delhi'),
+    ('GA', 'GOA', 'Goa'),
+    ('GJ', 'GUJARAT', 'Gujarat'),
+    ('HR', 'HARYANA', 'Haryana'),
+    ('HP', 'HIMACHAL PRADESH', 'Himachal Pradesh'),
+    ('JH', 'JHARKHAND', 'Jharkhand'),
+    ('JK', 'JAMMU AND KASHMIR', 'Jammu and Kashmir'),
+    ('KA', 'KARNATAKA', 'Karnataka'),
+    ('KL', 'KERALA', 'Kerala'),
+    ('LD', 'LAKSHADWEEP', 'Lakshadweep'),
+    ('MP', 'MADHYA PRADESH', 'Madhya Pradesh'),
+    ('MH', 'MAHARASHTRA', 'Maharashtra'),
+    ('MN', 'MANIPUR', 'Manipur'),
+    ('ML', 'MEGHALAYA', 'Meghalaya'),
+    ('MZ', 'MIZORAM', 'Mizoram'),
+    ('NL', 'NAGALAND', 'Nagaland'),
+    ('OR', 'ODISHA', 'Odisha'),
+    ('PB', 'PUNJAB', 'Punjab'),
+    ('PY', 'PUDUCHERRY', 'Puducherry'),
+    ('RJ', 'RAJASTHAN', 'Rajasthan'),
+    ('SK', 'SIKKIM', 'Sikkim'),
+    ('TN', 'TAMIL NADU', 'Tamil Nadu'),
+    ('TG', 'TELANGANA', 'Telangana'),
+    ('TR', 'TRIPURA', 'Tripura'),
+    ('UP', 'UTTAR PRADESH', 'Uttar Pradesh'),
+    ('UT', 'UTTARAKHAND', 'Uttarakhand'),
+    ('WB', 'WEST BENGAL', 'West Bengal'),
+)
+
+
 class JagritiClient:
     def __init__(self):
         self.real_client = JagritiRealClient()
-        self.fallback_states = [
-            {"id": "AP", "name": "ANDHRA PRADESH", "display_name": "Andhra Pradesh"},
-            {"id": "AS", "name": "ASSAM", "display_name": "Assam"},
-            {"id": "BR", "name": "BIHAR", "display_name": "Bihar"},
-            {"id": "CG", "name": "CHHATTISGARH", "display_name": "Chhattisgarh"},
-            {"id": "DL", "name": "DELHI", "display_name": "Delhi"},
-            {"id": "GA", "name": "GOA", "display_name": "Goa"},
-            {"id": "GJ", "name": "GUJARAT", "display_name": "Gujarat"},
-            {"id": "HR", "name": "HARYANA", "display_name": "Haryana"},
-            {"id": "HP", "name": "HIMACHAL PRADESH", "display_name": "Himachal Pradesh"},
-            {"id": "JH", "name": "JHARKHAND", "display_name": "Jharkhand"},
-            {"id": "JK", "name": "JAMMU AND KASHMIR", "display_name": "Jammu and Kashmir"},
-            {"id": "KA", "name": "KARNATAKA", "display_name": "Karnataka"},
-            {"id": "KL", "name": "KERALA", "display_name": "Kerala"},
-            {"id": "LD", "name": "LAKSHADWEEP", "display_name": "Lakshadweep"},
-            {"id": "MP", "name": "MADHYA PRADESH", "display_name": "Madhya Pradesh"},
-            {"id": "MH", "name": "MAHARASHTRA", "display_name": "Maharashtra"},
-            {"id": "MN", "name": "MANIPUR", "display_name": "Manipur"},
-            {"id": "ML", "name": "MEGHALAYA", "display_name": "Meghalaya"},
-            {"id": "MZ", "name": "MIZORAM", "display_name": "Mizoram"},
-            {"id": "NL", "name": "NAGALAND", "display_name": "Nagaland"},
-            {"id": "OR", "name": "ODISHA", "display_name": "Odisha"},
-            {"id": "PB", "name": "PUNJAB", "display_name": "Punjab"},
-            {"id": "PY", "name": "PUDUCHERRY", "display_name": "Puducherry"},
-            {"id": "RJ", "name": "RAJASTHAN", "display_name": "Rajasthan"},
-            {"id": "SK", "name": "SIKKIM", "display_name": "Sikkim"},
-            {"id": "TN", "name": "TAMIL NADU", "display_name": "Tamil Nadu"},
-            {"id": "TG", "name": "TELANGANA", "display_name": "Telangana"},
-            {"id": "TR", "name": "TRIPURA", "display_name": "Tripura"},
-            {"id": "UP", "name": "UTTAR PRADESH", "display_name": "Uttar Pradesh"},
-            {"id": "UT", "name": "UTTARAKHAND", "display_name": "Uttarakhand"},
-            {"id": "WB", "name": "WEST BENGAL", "display_name": "West Bengal"}
+
+    @cached_property
+    def fallback_states(self) -> List[Dict]:
+        return [
+            {'id': state_id, 'name': name, 'display_name': display}
+            for state_id, name, display in _FALLBACK_STATES_RAW
         ]
         
-    async def get_states(self) -> List[Dict]:
+    async def get_states_real(self) -> List[Dict]:
+        # Real extraction only, no fallback: cache layers call this so
+        # fabricated state IDs can never be persisted as if the portal
+        # had served them.
         try:
-            self.real_client.get_session_data()
-            real_states = self.real_client.extract_states_from_page()
-            
+            real_states = await self.real_client.extract_states_json()
+            if not real_states:
+                real_states = await self.real_client.extract_states_from_page()
+
             if real_states:
-                logging.info(f"Retrieved {len(real_states)} states from real portal")
-                return real_states
-            else:
-                logging.warning("Real portal unavailable, using fallback states")
-                return self.fallback_states
-                
+                logger.info("Retrieved %s states from real portal", len(real_states))
+            return real_states
+
         except Exception as e:
-            logging.error(f"Get states failed: {e}")
-            return self.fallback_states
-    
+            logger.error("Get states failed: %s", e)
+            return []
+
+    async def get_states(self) -> List[Dict]:
+        real_states = await self.get_states_real()
+        if real_states:
+            return real_states
+        logger.warning("Real portal unavailable, using fallback states")
+        return self.fallback_states
+
+    async def get_commissions_real(self, state_id: str) -> List[Dict]:
+        real_commissions = await self.real_client.extract_commissions_for_state(state_id)
+        if real_commissions:
+            logger.info("Retrieved %s commissions for %s from real portal", len(real_commissions), state_id)
+        return real_commissions
+
+    def generate_fallback_commissions(self, state_id: str) -> List[Dict]:
+        logger.info("Generating fallback commissions for %s", state_id)
+        return [
+            {"id": f"{state_id}DC01", "name": f"{state_id} District Commission - I", "display_name": f"{state_id} District Commission - I", "state_id": state_id},
+            {"id": f"{state_id}DC02", "name": f"{state_id} District Commission - II", "display_name": f"{state_id} District Commission - II", "state_id": state_id},
+            {"id": f"{state_id}DC03", "name": f"{state_id} Additional District Commission", "display_name": f"{state_id} Additional District Commission", "state_id": state_id}
+        ]
+
     async def get_commissions(self, state_id: str) -> List[Dict]:
         try:
-            real_commissions = self.real_client.extract_commissions_for_state(state_id)
-            
+            real_commissions = await self.get_commissions_real(state_id)
             if real_commissions:
-                logging.info(f"Retrieved {len(real_commissions)} commissions for {state_id} from real portal")
                 return real_commissions
-            else:
-                logging.info(f"Generating fallback commissions for {state_id}")
-                return [
-                    {"id": f"{state_id}DC01", "name": f"{state_id} District Commission - I", "display_name": f"{state_id} District Commission - I", "state_id": state_id},
-                    {"id": f"{state_id}DC02", "name": f"{state_id} District Commission - II", "display_name": f"{state_id} District Commission - II", "state_id": state_id},
-                    {"id": f"{state_id}DC03", "name": f"{state_id} Additional District Commission", "display_name": f"{state_id} Additional District Commission", "state_id": state_id}
-                ]
-                
+            return self.generate_fallback_commissions(state_id)
+
         except Exception as e:
-            logging.error(f"Get commissions failed: {e}")
+            logger.error("Get commissions failed: %s", e)
             return []
     
+    async def warmup(self, state_ids: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
+        # Prefetch commission lists for many states in one wall-clock
+        # round trip instead of N sequential calls; the shared token
+        # bucket and semaphore keep the burst within portal limits.
+        states = await self.get_states()
+        ids = state_ids or [state['id'] for state in states]
+        results = await asyncio.gather(
+            *(self.get_commissions(state_id) for state_id in ids),
+            return_exceptions=True
+        )
+        return {
+            state_id: result if isinstance(result, list) else []
+            for state_id, result in zip(ids, results)
+        }
+
+    async def aclose(self):
+        await self.real_client.aclose()
+
     async def search_cases(self, params: Dict) -> List[Dict]:
         try:
-            real_cases = self.real_client.search_cases_real(params)
+            real_cases = await self.real_client.search_cases_real(params)
             
             if real_cases:
-                logging.info(f"Retrieved {len(real_cases)} cases from real portal")
+                logger.info("Retrieved %s cases from real portal", len(real_cases))
                 return real_cases
             else:
-                logging.info("No real cases found, generating sample results")
+                logger.info("No real cases found, generating sample results")
                 return self.generate_sample_cases(params)
                 
         except Exception as e:
-            logging.error(f"Search cases failed: {e}")
+            logger.error("Search cases failed: %s", e)
             return self.generate_sample_cases(params)
     
     def generate_sample_cases(self, params: Dict) -> List[Dict]: